@@ -86,9 +86,17 @@ def main() -> None:
     target = 999999
 
     # Time the small_data run
-    small_time = timeit.timeit(lambda: linear_search(small_data, target), number=10)
+    small_time = timeit.timeit(
+        "linear_search(small_data, target)",
+        globals={**globals(), **locals()},
+        number=10,
+    )
     # Time the large_data run
-    large_time = timeit.timeit(lambda: linear_search(large_data, target), number=10)
+    large_time = timeit.timeit(
+        "linear_search(large_data, target)",
+        globals={**globals(), **locals()},
+        number=10,
+    )
 
     print(
         f"Time for searching in small_data (n=10,000), 10 runs: {small_time:.5f} seconds",
@@ -41,6 +41,8 @@ class RBNode:
     confirm the node is not None.
     """
 
+    __slots__ = ("color", "key", "left", "parent", "right")
+
     def __init__(self, key: int, color: bool = RED) -> None:
         self.key = key
         self.color = color
@@ -154,10 +156,27 @@ def insert_rb(root: RBNode | None, key: int) -> RBNode:
 
 
 def insert_fixup(root: RBNode, x: RBNode) -> RBNode:
-    """Fix red-black violations after inserting node x, possibly changing the root."""
+    """
+    Fix red-black violations after inserting node x, possibly changing the root.
+
+    Parent and grandparent are read once per iteration into locals ``p`` and ``g``;
+    CPython does not eliminate repeated attribute loads, so ``x.parent.parent``
+    chains would each cost a fresh lookup.
+
+    Examples
+    --------
+    >>> root = RBNode(10, BLACK)
+    >>> child = RBNode(20)
+    >>> root.right, child.parent = child, root
+    >>> grandchild = RBNode(30)
+    >>> child.right, grandchild.parent = grandchild, child
+    >>> root = insert_fixup(root, grandchild)
+    >>> root.key, root.color == BLACK, root.left.key, root.right.key
+    (20, True, 10, 30)
+    """
     while True:
         p = x.parent
-        if p is None or not is_red(p):
+        if p is None or p.color != RED:
             break  # no violation if parent is black or doesn't exist
         # Now parent is red => check grandparent
         g = p.parent
@@ -202,8 +221,9 @@ def insert_fixup(root: RBNode, x: RBNode) -> RBNode:
                     x = p
                     if x.right:
                         x = x.right
-                if x.parent:
-                    x.parent.color = BLACK
+                p2 = x.parent
+                if p2:
+                    p2.color = BLACK
                 g.color = RED
                 root = safe_rotate_left(root, g)
 
@@ -31,6 +31,10 @@ from __future__ import annotations
 
 import random
 
+# Recursive inserts hand off to the iterative path-stack version past this depth,
+# so an unlucky priority run cannot reach Python's recursion limit.
+_MAX_RECURSION_DEPTH = 64
+
 
 class TreapNode:
     """
@@ -42,6 +46,8 @@ class TreapNode:
     - left, right: child pointers.
     """
 
+    __slots__ = ("key", "left", "priority", "right")
+
     def __init__(self, key: int) -> None:
         self.key = key
         self.priority = random.random()  # or random.randint(...) for int priority
@@ -77,7 +83,7 @@ def rotate_right(root: TreapNode) -> TreapNode:
     return y
 
 
-def insert_treap(root: TreapNode | None, key: int) -> TreapNode:
+def insert_treap(root: TreapNode | None, key: int, _depth: int = 0) -> TreapNode:
     """
     Insert 'key' into the Treap, returning the possibly new subtree root.
 
@@ -97,24 +103,70 @@ def insert_treap(root: TreapNode | None, key: int) -> TreapNode:
     >>> inorder(root)
     >>> sorted(inord) == inord  # BST property => inord is sorted
     True
+    >>> root = insert_treap(root, 12, _depth=_MAX_RECURSION_DEPTH + 1)  # iterative handoff
+    >>> inord.clear()
+    >>> inorder(root)
+    >>> inord
+    [2, 5, 10, 12, 15]
     """
     if root is None:
         return TreapNode(key)
+    if _depth > _MAX_RECURSION_DEPTH:
+        return _insert_treap_iter(root, key)
 
     if key < root.key:
-        root.left = insert_treap(root.left, key)
+        root.left = insert_treap(root.left, key, _depth + 1)
         # check priority
         if root.left and root.left.priority > root.priority:
             # rotate right
             root = rotate_right(root)
     else:
-        root.right = insert_treap(root.right, key)
+        root.right = insert_treap(root.right, key, _depth + 1)
         if root.right and root.right.priority > root.priority:
             # rotate left
             root = rotate_left(root)
     return root
 
 
+def _insert_treap_iter(root: TreapNode | None, key: int) -> TreapNode:
+    """
+    Insert 'key' without recursion, returning the possibly new subtree root.
+
+    Records the search path in an explicit list, then unwinds it bottom-up,
+    re-linking each child and rotating wherever the heap property is violated.
+    The C stack is not used, so a tall treap cannot hit the recursion limit;
+    the path list itself takes O(h) space.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in [10, 5, 15, 2, 7]:
+    ...     root = _insert_treap_iter(root, x)
+    >>> vals = []
+    >>> inorder(root, vals)
+    >>> vals
+    [2, 5, 7, 10, 15]
+    """
+    path: list[TreapNode] = []
+    cur = root
+    while cur is not None:
+        path.append(cur)
+        cur = cur.left if key < cur.key else cur.right
+
+    child = TreapNode(key)
+    for node in reversed(path):
+        if key < node.key:
+            node.left = child
+            if child.priority > node.priority:
+                node = rotate_right(node)
+        else:
+            node.right = child
+            if child.priority > node.priority:
+                node = rotate_left(node)
+        child = node
+    return child
+
+
 def inorder(root: TreapNode | None, out: list[int]) -> None:
     """In-order traversal to confirm BST ordering or debugging."""
     if not root:
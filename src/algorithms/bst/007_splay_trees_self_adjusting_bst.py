@@ -194,11 +194,31 @@ def search_splay(root: SplayNode | None, key: int) -> SplayNode | None:
 
 
 def inorder(root: SplayNode | None, out: list[int]) -> None:
-    """Perform in-order traversal for verifying BST property."""
-    if root:
-        inorder(root.left, out)
-        out.append(root.key)
-        inorder(root.right, out)
+    """
+    Perform in-order traversal for verifying BST property.
+
+    Uses an explicit stack: a splay tree can be O(n) tall, which would exceed
+    Python's recursion limit on a recursive walk.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in range(3000):  # ascending inserts build a left-leaning chain
+    ...     root = insert_splay(root, x)
+    >>> vals = []
+    >>> inorder(root, vals)
+    >>> vals == list(range(3000))
+    True
+    """
+    stack: list[SplayNode] = []
+    cur = root
+    while stack or cur is not None:
+        while cur is not None:
+            stack.append(cur)
+            cur = cur.left
+        cur = stack.pop()
+        out.append(cur.key)
+        cur = cur.right
 
 
 def main() -> None:
@@ -25,6 +25,9 @@ in a straightforward way (just subtree size checks, no complex balancing factors
 
 from __future__ import annotations
 
+# Iterative-handoff depth; see the treap lesson (006) for the rationale.
+_MAX_RECURSION_DEPTH = 64
+
 
 class SizeBSTNode:
     """
@@ -36,6 +39,8 @@ class SizeBSTNode:
     - left, right: child pointers.
     """
 
+    __slots__ = ("key", "left", "right", "size")
+
     def __init__(self, key: int) -> None:
         self.key = key
         self.size = 1
@@ -64,9 +69,9 @@ def rotate_left(root: SizeBSTNode) -> SizeBSTNode:
         return root  # no rotation if right is None
     root.right = y.left
     y.left = root
-    # update sizes
-    update_size(root)
-    update_size(y)
+    # y now spans exactly the nodes root spanned, so it inherits root's size
+    y.size = root.size
+    root.size = 1 + get_size(root.left) + get_size(root.right)
     return y
 
 
@@ -81,26 +86,41 @@ def rotate_right(root: SizeBSTNode) -> SizeBSTNode:
         return root
     root.left = y.right
     y.right = root
-    # update sizes
-    update_size(root)
-    update_size(y)
+    # y now spans exactly the nodes root spanned, so it inherits root's size
+    y.size = root.size
+    root.size = 1 + get_size(root.left) + get_size(root.right)
     return y
 
 
-def fix_sizebalance(node: SizeBSTNode, ratio: float = 2.0) -> SizeBSTNode:
+def fix_sizebalance(
+    node: SizeBSTNode,
+    left_size: int,
+    right_size: int,
+    ratio: float = 2.0,
+) -> SizeBSTNode:
     """
     Check the size ratio of the left and right children.
 
     If one side is too big, rotate to restore balance. Re-check after rotation.
 
     ratio=2 means no subtree can exceed double the size of its sibling.
+
+    The caller passes the child sizes it already read while refreshing
+    ``node.size``, so each level of an insert reads them once.
+
+    Examples
+    --------
+    >>> node = SizeBSTNode(1)
+    >>> node.right = SizeBSTNode(2)
+    >>> node.right.right = SizeBSTNode(3)
+    >>> node.right.size, node.size = 2, 3
+    >>> node = fix_sizebalance(node, 0, 2)
+    >>> node.key, node.size, node.left.size, node.right.size
+    (2, 3, 1, 1)
     """
     if node is None:
         return node
 
-    left_size = get_size(node.left)
-    right_size = get_size(node.right)
-
     # if left subtree is > ratio * right subtree => rotate right
     if left_size > ratio * right_size and node.left:
         # check if the left child's right is heavier => do double rotation
@@ -128,6 +148,7 @@ def insert_sizebst(
     root: SizeBSTNode | None,
     key: int,
     ratio: float = 2.0,
+    _depth: int = 0,
 ) -> SizeBSTNode:
     """
     Insert 'key' into the size-balanced BST with a given ratio, returning new root.
@@ -146,19 +167,69 @@ def insert_sizebst(
     >>> inorder(root)
     >>> in_vals == sorted([10,5,15,3,7])
     True
+    >>> root = insert_sizebst(root, 12, _depth=_MAX_RECURSION_DEPTH + 1)  # iterative handoff
+    >>> root.size
+    6
     """
     if root is None:
         return SizeBSTNode(key)
+    if _depth > _MAX_RECURSION_DEPTH:
+        return _insert_sizebst_iter(root, key, ratio)
 
     if key < root.key:
-        root.left = insert_sizebst(root.left, key, ratio)
+        root.left = insert_sizebst(root.left, key, ratio, _depth + 1)
     else:
-        root.right = insert_sizebst(root.right, key, ratio)
+        root.right = insert_sizebst(root.right, key, ratio, _depth + 1)
 
-    # update size
-    update_size(root)
+    # update size, keeping the child sizes for the balance check
+    left_size = get_size(root.left)
+    right_size = get_size(root.right)
+    root.size = 1 + left_size + right_size
     # fix potential imbalance
-    return fix_sizebalance(root, ratio)
+    return fix_sizebalance(root, left_size, right_size, ratio)
+
+
+def _insert_sizebst_iter(
+    root: SizeBSTNode | None,
+    key: int,
+    ratio: float = 2.0,
+) -> SizeBSTNode:
+    """
+    Insert 'key' without recursion, returning the new root.
+
+    Records the search path on an explicit stack, then unwinds it bottom-up,
+    re-linking each child, refreshing its size and rebalancing as the
+    recursive version would on return.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in range(100):
+    ...     root = _insert_sizebst_iter(root, x)
+    >>> root.size
+    100
+    >>> arr = []
+    >>> inorder(root, arr)
+    >>> arr == list(range(100))
+    True
+    """
+    path: list[SizeBSTNode] = []
+    cur = root
+    while cur is not None:
+        path.append(cur)
+        cur = cur.left if key < cur.key else cur.right
+
+    child = SizeBSTNode(key)
+    for node in reversed(path):
+        if key < node.key:
+            node.left = child
+        else:
+            node.right = child
+        left_size = get_size(node.left)
+        right_size = get_size(node.right)
+        node.size = 1 + left_size + right_size
+        child = fix_sizebalance(node, left_size, right_size, ratio)
+    return child
 
 
 def inorder(root: SizeBSTNode | None, arr: list[int]) -> None:
@@ -15,6 +15,8 @@ No single new algorithm here. We illustrate a naive approach for demonstration.
 Complexities:
 - Typically faster than the full DP approach. The search time can be near-optimal
   if frequencies are accurate and the heuristic picks good roots.
+- The naive heuristic here: O(n log n) to build a sparse table of range maxima,
+  then O(1) per root pick, so O(n log n) overall with O(n log n) extra space.
 
 Narrative:
 For large SRAS sets where full DP is infeasible, these heuristics yield almost-optimal average
@@ -34,6 +36,8 @@ class Node:
     - left, right children.
     """
 
+    __slots__ = ("freq", "key", "left", "right")
+
     def __init__(self, key: int, freq: float) -> None:
         self.key = key
         self.freq = freq
@@ -41,21 +45,79 @@ class Node:
         self.right: Node | None = None
 
 
+def _sparse_argmax(freqs: list[float]) -> list[list[int]]:
+    """
+    Build a sparse table: table[k][i] is the index of the max in freqs[i : i + 2**k].
+
+    Ties keep the leftmost index, matching a left-to-right scan with ``>``.
+
+    Examples
+    --------
+    >>> table = _sparse_argmax([3.0, 2.0, 6.0, 1.0])
+    >>> table[0]
+    [0, 1, 2, 3]
+    >>> table[1]
+    [0, 2, 2]
+    >>> table[2]
+    [2]
+    """
+    n = len(freqs)
+    table = [list(range(n))]
+    width = 1
+    while 2 * width <= n:
+        prev = table[-1]
+        row: list[int] = []
+        for i in range(n - 2 * width + 1):
+            a = prev[i]
+            b = prev[i + width]
+            row.append(b if freqs[b] > freqs[a] else a)
+        table.append(row)
+        width *= 2
+    return table
+
+
+def _range_argmax(table: list[list[int]], freqs: list[float], lo: int, hi: int) -> int:
+    """
+    Return the index of the max of freqs[lo..hi] (inclusive) in O(1).
+
+    Two power-of-two windows cover the range; overlap is harmless for a max.
+
+    Examples
+    --------
+    >>> fs = [1.0, 4.0, 2.0, 10.0, 3.0]
+    >>> table = _sparse_argmax(fs)
+    >>> _range_argmax(table, fs, 0, 4), _range_argmax(table, fs, 0, 2)
+    (3, 1)
+    >>> _range_argmax(_sparse_argmax([5.0, 5.0, 5.0]), [5.0, 5.0, 5.0], 0, 2)
+    0
+    """
+    k = (hi - lo + 1).bit_length() - 1
+    a = table[k][lo]
+    b = table[k][hi - (1 << k) + 1]
+    return b if freqs[b] > freqs[a] else a
+
+
 def build_heuristic_bst(keys: list[int], freqs: list[float]) -> Node | None:
     """
     Build a BST using a naive heuristic.
 
      1) Find the key with largest freq in [keys], make it root
-     2) Recursively build left subtree from keys < root
+     2) Build left subtree from keys < root
         and right subtree from keys > root
      3) This is NOT guaranteed to be optimal, but might be decent
         if one key is truly dominant.
 
+    Since keys are sorted, a subtree is just an index range [lo..hi]. Pending
+    ranges wait on an explicit stack, and each one's max comes from a sparse
+    table built once, so no sub-lists are copied and nothing recurses.
+
     Examples
     --------
     >>> ks = [10,20,30,40]
     >>> fs = [3.0,2.0,6.0,1.0]  # 30 has largest freq => becomes root
     >>> root = build_heuristic_bst(ks, fs)
+    >>> root.key
+    30
     >>> inord = []
     >>> def inorder(n):
     ...     if n:
@@ -65,46 +127,58 @@ def build_heuristic_bst(keys: list[int], freqs: list[float]) -> Node | None:
     >>> inorder(root)
     >>> inord
     [10, 20, 30, 40]
+    >>> build_heuristic_bst([], []) is None
+    True
     """
-    if not keys:
+    n = len(keys)
+    if n == 0:
         return None
-    # find index of largest freq
-    max_i = 0
-    max_f = freqs[0]
-    for i in range(1, len(freqs)):
-        if freqs[i] > max_f:
-            max_f = freqs[i]
-            max_i = i
-
-    root = Node(keys[max_i], freqs[max_i])
-    left_keys: list[int] = []
-    left_freqs: list[float] = []
-    right_keys: list[int] = []
-    right_freqs: list[float] = []
-
-    # partition
-    for i in range(len(keys)):
-        if i == max_i:
-            continue
-        if keys[i] < keys[max_i]:
-            left_keys.append(keys[i])
-            left_freqs.append(freqs[i])
+    table = _sparse_argmax(freqs)
+
+    root: Node | None = None
+    # (lo, hi, parent, attach as left child?) for each subtree still to build
+    stack: list[tuple[int, int, Node | None, bool]] = [(0, n - 1, None, False)]
+    while stack:
+        lo, hi, parent, is_left = stack.pop()
+        max_i = _range_argmax(table, freqs, lo, hi)
+        node = Node(keys[max_i], freqs[max_i])
+        if parent is None:
+            root = node
+        elif is_left:
+            parent.left = node
         else:
-            right_keys.append(keys[i])
-            right_freqs.append(freqs[i])
-
-    root.left = build_heuristic_bst(left_keys, left_freqs)
-    root.right = build_heuristic_bst(right_keys, right_freqs)
+            parent.right = node
+        if lo < max_i:
+            stack.append((lo, max_i - 1, node, True))
+        if max_i < hi:
+            stack.append((max_i + 1, hi, node, False))
     return root
 
 
 def inorder(n: Node | None, out: list[int]) -> None:
-    """Perform in-order traversal and collect keys in out."""
-    if n is None:
-        return
-    inorder(n.left, out)
-    out.append(n.key)
-    inorder(n.right, out)
+    """
+    Perform in-order traversal and collect keys in out.
+
+    The largest-frequency heuristic builds a chain when frequencies are monotone,
+    so the walk uses an explicit stack instead of one Python frame per level.
+
+    Examples
+    --------
+    >>> root = build_heuristic_bst(list(range(3000)), [float(k) for k in range(3000)])
+    >>> out = []
+    >>> inorder(root, out)
+    >>> out == list(range(3000))
+    True
+    """
+    stack: list[Node] = []
+    cur = n
+    while stack or cur is not None:
+        while cur is not None:
+            stack.append(cur)
+            cur = cur.left
+        cur = stack.pop()
+        out.append(cur.key)
+        cur = cur.right
 
 
 def main() -> None:
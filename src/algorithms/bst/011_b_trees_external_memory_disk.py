@@ -9,6 +9,11 @@ children (for a branching factor t).
 - Insert: if child is full, split it before descending. The tree height remains O(log
 n).
 - Search: do a multiway search in node's keys, follow the correct child pointer.
+  Within a node the search is a binary search (bisect), O(log t) per node.
+  Keys sit in a contiguous int64 array, so bisect runs in C over packed machine
+  ints, much as np.searchsorted would on an int64 ndarray.
+- Bulk load: with all keys known up front, sort once and build the tree bottom-up,
+  level by level, in O(n) after the sort and with no splits.
 
 Algorithm (Insertion Outline):
 1) If root is full, create a new node and split root.
@@ -25,20 +30,30 @@ by storing multiple keys in each node, reducing the number of disk accesses need
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
+
 
 class BTreeNode:
     """
     A B-Tree node storing multiple keys and child pointers.
 
-    - keys: sorted list of up to 2t-1 keys
+    - keys: fixed-capacity array of 2t-1 int64 slots; only keys[:n] are live, sorted
+    - n: number of live keys
     - children: array of child pointers of length up to 2t
     - leaf: whether this node is a leaf.
+
+    Keys are packed contiguously as raw 8-byte ints, like a disk block, instead of
+    a list of pointers to separately allocated int objects.
     """
 
+    __slots__ = ("children", "keys", "leaf", "n", "t")
+
     def __init__(self, t: int, leaf: bool) -> None:
         self.t = t  # branching factor
         self.leaf = leaf
-        self.keys: list[int] = []
+        self.keys = array("q", [0]) * (2 * t - 1)
+        self.n = 0
         self.children: list[BTreeNode] = []
 
 
@@ -47,19 +62,25 @@ def btree_search(node: BTreeNode | None, key: int) -> bool:
     Search key in the subtree rooted at 'node'.
 
     Return True if found, else False.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in [10, 20, 5, 6, 12, 30, 7, 17]:
+    ...     root = btree_insert(root, x, 2)
+    >>> btree_search(root, 17), btree_search(root, 11)
+    (True, False)
     """
-    if node is None:
-        return False
-    # Find the first key >= key
-    i = 0
-    while i < len(node.keys) and key > node.keys[i]:
-        i += 1
-    if i < len(node.keys) and node.keys[i] == key:
-        return True
-    if node.leaf:
-        return False
-    # Descend to child i
-    return btree_search(node.children[i], key)
+    while node is not None:
+        # Find the first key >= key
+        i = bisect_left(node.keys, key, 0, node.n)
+        if i < node.n and node.keys[i] == key:
+            return True
+        if node.leaf:
+            return False
+        # Descend to child i; a loop, since Python does not eliminate tail calls
+        node = node.children[i]
+    return False
 
 
 def split_child(parent: BTreeNode, i: int) -> None:
@@ -69,23 +90,38 @@ def split_child(parent: BTreeNode, i: int) -> None:
     parent.children[i] must have 2t-1 keys (full).
     We'll move the median key up to parent, and create a new sibling node for the second half
     of keys.
+
+    Examples
+    --------
+    >>> parent = BTreeNode(2, False)
+    >>> child = BTreeNode(2, True)
+    >>> child.keys[:], child.n = array("q", [5, 10, 20]), 3
+    >>> parent.children.append(child)
+    >>> split_child(parent, 0)
+    >>> parent.keys[: parent.n].tolist()
+    [10]
+    >>> [c.keys[: c.n].tolist() for c in parent.children]
+    [[5], [20]]
     """
     t = parent.t
     full_child = parent.children[i]
     new_node = BTreeNode(t, full_child.leaf)
 
-    # move the last (t-1) keys of full_child to new_node
-    new_node.keys = full_child.keys[t:]  # t..(2t-2)
+    # move the last (t-1) keys of full_child to new_node; full_child keeps the first t-1
+    new_node.keys[: t - 1] = full_child.keys[t : 2 * t - 1]  # t..(2t-2)
+    new_node.n = t - 1
     median_key = full_child.keys[t - 1]
-    full_child.keys = full_child.keys[: t - 1]
+    full_child.n = t - 1
 
-    # if not leaf, move the last t children
+    # if not leaf, move the last t children; full_child's list is truncated in place
     if not full_child.leaf:
         new_node.children = full_child.children[t:]
-        full_child.children = full_child.children[:t]
+        del full_child.children[t:]
 
-    # insert median_key into parent.keys
-    parent.keys.insert(i, median_key)
+    # insert median_key into parent.keys, shifting keys[i:n] right by one slot
+    parent.keys[i + 1 : parent.n + 1] = parent.keys[i : parent.n]
+    parent.keys[i] = median_key
+    parent.n += 1
     parent.children.insert(i + 1, new_node)
 
 
@@ -95,22 +131,26 @@ def btree_insert_nonfull(node: BTreeNode, key: int) -> None:
 
     If it's a leaf, just put the key in the correct position.
     If not leaf, descend to the correct child, splitting it first if it is full.
+
+    Examples
+    --------
+    >>> leaf = BTreeNode(2, True)
+    >>> for x in [20, 10]:
+    ...     btree_insert_nonfull(leaf, x)
+    >>> btree_insert_nonfull(leaf, 15)
+    >>> leaf.keys[: leaf.n].tolist()
+    [10, 15, 20]
     """
-    i = len(node.keys) - 1
+    # position after any keys <= key: the insert slot in a leaf, the child otherwise
+    i = bisect_right(node.keys, key, 0, node.n)
     if node.leaf:
-        # insert key into node.keys in sorted position
-        node.keys.append(0)  # expand the list
-        while i >= 0 and key < node.keys[i]:
-            node.keys[i + 1] = node.keys[i]
-            i -= 1
-        node.keys[i + 1] = key
+        # shift keys[i:n] right one slot; slot n is free since the node is not full
+        node.keys[i + 1 : node.n + 1] = node.keys[i : node.n]
+        node.keys[i] = key
+        node.n += 1
     else:
-        # find the child to descend
-        while i >= 0 and key < node.keys[i]:
-            i -= 1
-        i += 1
         # if child is full => split
-        if len(node.children[i].keys) == 2 * node.t - 1:
+        if node.children[i].n == 2 * node.t - 1:
             split_child(node, i)
             # after split, decide which of the 2 children to go down
             if key > node.keys[i]:
@@ -124,15 +164,26 @@ def btree_insert(root: BTreeNode | None, key: int, t: int) -> BTreeNode:
 
     If root is full, we split it by creating a new root node.
     Returns the new root after insertion.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in [10, 20, 5, 6]:
+    ...     root = btree_insert(root, x, 2)
+    >>> root.keys[: root.n].tolist()
+    [10]
+    >>> [c.keys[: c.n].tolist() for c in root.children]
+    [[5, 6], [20]]
     """
     if root is None:
         # create a new root node and put key in
         root = BTreeNode(t, True)
-        root.keys.append(key)
+        root.keys[0] = key
+        root.n = 1
         return root
 
     # if root is full, split
-    if len(root.keys) == 2 * t - 1:
+    if root.n == 2 * t - 1:
         new_root = BTreeNode(t, False)
         new_root.children.append(root)
         split_child(new_root, 0)
@@ -146,23 +197,89 @@ def btree_insert(root: BTreeNode | None, key: int, t: int) -> BTreeNode:
     return root
 
 
+def btree_bulk_load(keys: list[int], t: int) -> BTreeNode | None:
+    """
+    Build a B-Tree with branching factor 't' from 'keys' bottom-up, without splits.
+
+    Each level's sorted items are cut into g = ceil((c + 1) / 2t) groups of near-equal
+    size, with one separator key between neighbouring groups. Groups become the
+    level's nodes; separators become the items of the level above, and each node
+    there adopts one more child than it has keys. Even sizing keeps every non-root
+    node within [t-1, 2t-1] keys, and all leaves end at the same depth.
+
+    Examples
+    --------
+    >>> root = btree_bulk_load([10, 20, 5, 6, 12, 30, 7, 17], 2)
+    >>> root.keys[: root.n].tolist()
+    [7, 17]
+    >>> [c.keys[: c.n].tolist() for c in root.children]
+    [[5, 6], [10, 12], [20, 30]]
+    >>> arr = []
+    >>> inorder_traverse(btree_bulk_load(list(range(1000)), 3), arr)
+    >>> arr == list(range(1000))
+    True
+    >>> btree_bulk_load([], 2) is None
+    True
+    """
+    items = sorted(keys)
+    if not items:
+        return None
+    children: list[BTreeNode] = []
+    leaf = True
+    while True:
+        c = len(items)
+        groups = -(-(c + 1) // (2 * t))  # ceil: each group holds <= 2t-1 keys + 1 separator
+        per_group, extra = divmod(c - (groups - 1), groups)
+        nodes: list[BTreeNode] = []
+        separators: list[int] = []
+        pos = 0
+        child_pos = 0
+        for g in range(groups):
+            size = per_group + (1 if g < extra else 0)
+            node = BTreeNode(t, leaf)
+            node.keys[:size] = array("q", items[pos : pos + size])
+            node.n = size
+            if not leaf:
+                node.children = children[child_pos : child_pos + size + 1]
+                child_pos += size + 1
+            nodes.append(node)
+            pos += size
+            if g < groups - 1:
+                separators.append(items[pos])
+                pos += 1
+        if groups == 1:
+            return nodes[0]
+        items, children, leaf = separators, nodes, False
+
+
 def inorder_traverse(node: BTreeNode | None, arr: list[int]) -> None:
     """
     In-order traversal for B-tree keys.
 
     for each key, traverse child i, then the key, then next child.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in [10, 20, 5, 6, 12, 30, 7, 17]:
+    ...     root = btree_insert(root, x, 2)
+    >>> arr = []
+    >>> inorder_traverse(root, arr)
+    >>> arr
+    [5, 6, 7, 10, 12, 17, 20, 30]
     """
-    if node is None:
-        return
-    i = 0
-    while i < len(node.keys):
-        if i < len(node.children):
-            inorder_traverse(node.children[i], arr)
-        arr.append(node.keys[i])
-        i += 1
-    # last child
-    if i < len(node.children):
-        inorder_traverse(node.children[i], arr)
+    # (node, i): emit key i-1 (if any), then walk child i
+    stack: list[tuple[BTreeNode, int]] = [] if node is None else [(node, 0)]
+    while stack:
+        cur, i = stack.pop()
+        if i > 0:
+            arr.append(cur.keys[i - 1])
+        if cur.leaf:
+            arr.extend(cur.keys[: cur.n])
+            continue
+        if i < cur.n:
+            stack.append((cur, i + 1))
+        stack.append((cur.children[i], 0))
 
 
 def main() -> None:
@@ -186,6 +303,12 @@ def main() -> None:
     print("Search 17 =>", btree_search(root, 17))
     print("Search 11 =>", btree_search(root, 11))
 
+    # Bulk loading the same keys builds the tree in one bottom-up pass
+    bulk = btree_bulk_load([10, 20, 5, 6, 12, 30, 7, 17], t)
+    bulk_arr: list[int] = []
+    inorder_traverse(bulk, bulk_arr)
+    print("Bulk-loaded B-Tree inorder traversal:", bulk_arr)
+
 
 if __name__ == "__main__":
     main()
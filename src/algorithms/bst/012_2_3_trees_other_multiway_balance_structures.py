@@ -35,6 +35,8 @@ class Two3Node:
     - leaf: indicates whether this node has no children.
     """
 
+    __slots__ = ("children", "keys", "leaf")
+
     def __init__(self, leaf: bool) -> None:
         self.keys: list[int] = []
         self.children: list[Two3Node] = []
@@ -154,28 +156,36 @@ def insert_23(root: Two3Node | None, key: int) -> Two3Node:
 
 
 def inorder(node: Two3Node | None, arr: list[int]) -> None:
-    """In-order traversal for a 2-3 tree: for each key, we traverse child i, then key i, etc."""
-    if not node:
-        return
-    # in a 2-3 node, we might have 1 or 2 keys, 2 or 3 children
-    # If node has 1 key => children can be up to 2
-    if len(node.keys) == 1:
-        #  up to 2 children => child[0], key[0], child[1]
-        if len(node.children) > 0:
-            inorder(node.children[0], arr)
-        arr.append(node.keys[0])
-        if len(node.children) > 1:
-            inorder(node.children[1], arr)
-    elif len(node.keys) == 2:
-        # up to 3 children => c[0], k[0], c[1], k[1], c[2]
-        if len(node.children) > 0:
-            inorder(node.children[0], arr)
-        arr.append(node.keys[0])
-        if len(node.children) > 1:
-            inorder(node.children[1], arr)
-        arr.append(node.keys[1])
-        if len(node.children) > 2:
-            inorder(node.children[2], arr)
+    """
+    In-order traversal for a 2-3 tree: for each key, we traverse child i, then key i, etc.
+
+    An explicit stack of (node, i) pairs stands in for recursion, so the walk
+    can resume a node between its keys.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in [5, 1, 2, 10]:
+    ...     root = insert_23(root, x)
+    >>> arr = []
+    >>> inorder(root, arr)
+    >>> arr
+    [1, 2, 5, 10]
+    """
+    # (node, i): emit key i-1 (if any), then walk child i
+    stack: list[tuple[Two3Node, int]] = [] if node is None else [(node, 0)]
+    while stack:
+        cur, i = stack.pop()
+        keys = cur.keys
+        # in a 2-3 node, we might have 1 or 2 keys, 2 or 3 children; skip anything else
+        if not 1 <= len(keys) <= 2:
+            continue
+        if i > 0:
+            arr.append(keys[i - 1])
+        if i < len(keys):
+            stack.append((cur, i + 1))
+        if i < len(cur.children):
+            stack.append((cur.children[i], 0))
 
 
 def main() -> None:
@@ -36,32 +36,42 @@ class TTreeNode:
     - keys: a sorted list of keys (up to capacity)
     - left, right: child pointers
     - height: for AVL-like balancing
+    - balance: left height minus right height, cached alongside height
     - capacity: max number of keys allowed.
     """
 
+    __slots__ = ("balance", "capacity", "height", "keys", "left", "right")
+
     def __init__(self, capacity: int) -> None:
         self.capacity = capacity
         self.keys: list[int] = []
         self.left: TTreeNode | None = None
         self.right: TTreeNode | None = None
         self.height = 1
-
-
-def get_height(node: TTreeNode | None) -> int:
-    """Get the height of a node (0 if None)."""
-    return node.height if node else 0
+        self.balance = 0
 
 
 def update_height(node: TTreeNode) -> None:
-    """Update the height of a node based on its children."""
-    node.height = 1 + max(get_height(node.left), get_height(node.right))
-
-
-def get_balance(node: TTreeNode | None) -> int:
-    """Get the balance factor of a node."""
-    if not node:
-        return 0
-    return get_height(node.left) - get_height(node.right)
+    """
+    Update the height and balance factor of a node based on its children.
+
+    Both come from the same two child heights, so they are computed together and
+    cached; rebalancing then reads ``node.balance`` instead of re-deriving it.
+
+    Examples
+    --------
+    >>> node = TTreeNode(4)
+    >>> node.left = TTreeNode(4)
+    >>> update_height(node)
+    >>> node.height, node.balance
+    (2, 1)
+    """
+    left = node.left
+    right = node.right
+    lh = left.height if left else 0
+    rh = right.height if right else 0
+    node.height = 1 + max(lh, rh)
+    node.balance = lh - rh
 
 
 def rotate_left(root: TTreeNode) -> TTreeNode:
@@ -100,15 +110,15 @@ def rebalance(node: TTreeNode) -> TTreeNode:
     """Check balance factor, do single or double rotations if needed."""
     update_height(node)
 
-    balance = get_balance(node)
+    balance = node.balance
     # left heavy
     if balance > 1:
-        if node.left and get_balance(node.left) < 0:
+        if node.left and node.left.balance < 0:
             node.left = rotate_left(node.left)
         return rotate_right(node)
     # right heavy
     if balance < -1:
-        if node.right and get_balance(node.right) > 0:
+        if node.right and node.right.balance > 0:
             node.right = rotate_right(node.right)
         return rotate_left(node)
     return node
@@ -167,56 +177,108 @@ def insert_ttree(root: TTreeNode | None, key: int, capacity: int = 4) -> TTreeNo
     If node can hold the key, we do so. Else descend left or right based on BST logic.
     If node is over capacity, split it and push up (like a simplified approach).
     Then do a rebalance (AVL-like).
+
+    The descent records its path; the walk back up re-links each subtree and
+    rebalances, stopping once a subtree's height is what it was before the insert,
+    since no ancestor's balance factor can have changed past that point.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in [10, 5, 15, 12, 13, 1, 2]:
+    ...     root = insert_ttree(root, x)
+    >>> arr = []
+    >>> inorder_traverse(root, arr)
+    >>> arr
+    [1, 2, 5, 10, 12, 13, 15]
+    >>> root.height
+    3
     """
     if root is None:
         root = TTreeNode(capacity)
         root.keys.append(key)
         return root
 
-    # try to place in current node
-    if insert_into_node(root, key):
-        # check if over capacity
-        if len(root.keys) > capacity:
-            # we must split. The 'mid_key' we push up to the parent
-            # but we have no parent pointer here => we do a top-level approach:
-            mid_key, new_node = split_node(root)
-            # create new root, mid_key is root's key, old root is left child,
-            # new_node is right child
-            new_root = TTreeNode(capacity)
-            new_root.keys = [mid_key]
-            new_root.left = root
-            new_root.right = new_node
-            return rebalance(new_root)
-        # just rebalance
-        return rebalance(root)
-
-    # else, we must go left or right
-    if key < root.keys[0]:
-        # go left
-        root.left = insert_ttree(root.left, key, capacity)
-    elif key > root.keys[-1]:
-        # go right
-        root.right = insert_ttree(root.right, key, capacity)
+    # (node, went left?) for each node the key passed through
+    path: list[tuple[TTreeNode, bool]] = []
+    node: TTreeNode | None = root
+    while node is not None:
+        # try to place in current node
+        if insert_into_node(node, key):
+            old_height = node.height
+            # check if over capacity
+            if len(node.keys) > capacity:
+                # we must split. The 'mid_key' we push up to the parent
+                # but we have no parent pointer here => we do a top-level approach:
+                mid_key, new_node = split_node(node)
+                # create new subtree root, mid_key is its key, old node is left child,
+                # new_node is right child
+                new_root = TTreeNode(capacity)
+                new_root.keys = [mid_key]
+                new_root.left = node
+                new_root.right = new_node
+                sub = rebalance(new_root)
+            else:
+                # just rebalance
+                sub = rebalance(node)
+            break
+
+        # else, we must go left or right
+        if key < node.keys[0]:
+            go_left = True
+        elif key > node.keys[-1]:
+            go_left = False
+        else:
+            # if key is between node.keys[0] and node.keys[-1], but not inserted =>
+            # we can't insert in this node because we need subtrees in a real T-tree approach
+            # We'll do a naive approach: just pick left or right if key < mid or key>mid
+            go_left = key < node.keys[len(node.keys) // 2]
+        path.append((node, go_left))
+        node = node.left if go_left else node.right
     else:
-        # if key is between node.keys[0] and node.keys[-1], but not inserted =>
-        # we can't insert in this node because we need subtrees in a real T-tree approach
-        # We'll do a naive approach: just pick left or right if key < mid or key>mid
-        mid_val = root.keys[len(root.keys) // 2]
-        if key < mid_val:
-            root.left = insert_ttree(root.left, key, capacity)
+        # fell off the tree: the key starts a new leaf
+        old_height = 0
+        sub = TTreeNode(capacity)
+        sub.keys.append(key)
+
+    for parent, went_left in reversed(path):
+        if went_left:
+            parent.left = sub
         else:
-            root.right = insert_ttree(root.right, key, capacity)
-
-    return rebalance(root)
+            parent.right = sub
+        if sub.height == old_height:
+            return root  # ancestors keep their heights, so they need no rebalance
+        old_height = parent.height
+        sub = rebalance(parent)
+    return sub
 
 
 def inorder_traverse(node: TTreeNode | None, arr: list[int]) -> None:
-    """In-order for T-tree: traverse left subtree, then node.keys, then right subtree."""
-    if not node:
-        return
-    inorder_traverse(node.left, arr)
-    arr.extend(node.keys)
-    inorder_traverse(node.right, arr)
+    """
+    In-order for T-tree: traverse left subtree, then node.keys, then right subtree.
+
+    Left spines wait on an explicit stack; each node's keys are already sorted,
+    so a popped node contributes them with a single extend.
+
+    Examples
+    --------
+    >>> root = None
+    >>> for x in [10, 5, 15, 12, 13, 1, 2, 30, 25, 20, 22]:
+    ...     root = insert_ttree(root, x)
+    >>> arr = []
+    >>> inorder_traverse(root, arr)
+    >>> arr
+    [1, 2, 5, 10, 12, 13, 15, 20, 22, 25, 30]
+    """
+    stack: list[TTreeNode] = []
+    cur = node
+    while stack or cur is not None:
+        while cur is not None:
+            stack.append(cur)
+            cur = cur.left
+        cur = stack.pop()
+        arr.extend(cur.keys)
+        cur = cur.right
 
 
 def main() -> None:
@@ -7,8 +7,12 @@ Data Structure: Stack (LIFO)
 Concepts:
 A stack is a Last-In-First-Out data structure. We push items onto the top and pop items from the
 top.
-We can implement a stack in Python using `collections.deque` or a list. Using `deque` is typically
-more efficient for push/pop at the ends.
+We can implement a stack in Python using `collections.deque` or a list. A stack only touches one
+end, so a plain list serves well: `append`/`pop` work at its tail, and its spare capacity is
+reused across pushes. `deque` pays off when both ends are used (see queues), at the cost of
+managing a chain of fixed-size blocks.
+When every item is a machine integer (IDs, step numbers), IntStack keeps them inline in an
+`array.array`: 8 bytes each instead of a pointer plus a 28+ byte int object.
 
 Complexities:
 - Push (append at end): O(1) amortized
@@ -18,9 +22,9 @@ Complexities:
 - Space: O(n)
 
 No best/average/worst differences for push/pop in amortized terms-they're consistently O(1)
-amortized with deque.
-Worst case scenario: if large memory reallocations occur rarely in a list, push/pop could degrade,
-but with `deque` this is stable O(1).
+amortized with a list.
+Worst case scenario: a push that outgrows the list's capacity reallocates and copies, O(n) for
+that one push. Capacity grows geometrically, so this is rare and averages out to O(1).
 
 Narrative:
 In our data analytics pipeline, a stack can help manage tasks in a LIFO manner. For example, if we
@@ -34,13 +38,21 @@ order.
 Run `python -m doctest -v thisfile.py` or `pytest --doctest-modules` to verify.
 """
 
-from collections import deque
+from array import array
+from collections.abc import Callable
 from typing import Any
 
 
 class Stack:
     """
-    A simple Stack using collections.deque for O(1) amortized push/pop operations.
+    A simple Stack backed by a list, with O(1) amortized push/pop at its tail.
+
+    Attributes
+    ----------
+    push : Callable[[Any], None]
+        push(item) pushes an item onto the stack. It is an instance attribute
+        bound to the backing list's append, so a push runs no Python frame of
+        its own.
 
     Examples
     --------
@@ -73,25 +85,27 @@ class Stack:
     peek from empty stack
     """
 
-    def __init__(self) -> None:
-        self._data = deque()  # type: deque[Any]
+    __slots__ = ("_data", "push")
 
-    def push(self, item: Any) -> None:
-        """Push an item onto the stack."""
-        self._data.append(item)
+    def __init__(self) -> None:
+        self._data: list[Any] = []
+        self.push: Callable[[Any], None] = self._data.append
 
     def pop(self) -> Any:
         """Pop and return the top item from the stack.
 
+        The list does the empty check itself; we only reword its error.
+
         Raises
         ------
         IndexError
             If the stack is empty.
         """
-        if self.is_empty():
+        try:
+            return self._data.pop()
+        except IndexError:
             msg = "pop from empty stack"
-            raise IndexError(msg)
-        return self._data.pop()
+            raise IndexError(msg) from None
 
     def peek(self) -> Any:
         """Return the top item without removing it.
@@ -101,10 +115,138 @@ class Stack:
         IndexError
             If the stack is empty.
         """
-        if self.is_empty():
+        try:
+            return self._data[-1]
+        except IndexError:
+            msg = "peek from empty stack"
+            raise IndexError(msg) from None
+
+    def __getstate__(self) -> list[Any]:
+        """
+        Return the backing container for copy and pickle.
+
+        The bound push is left out: it belongs to this instance's container,
+        so __setstate__ rebinds it to whichever container the copy receives.
+
+        Examples
+        --------
+        >>> import copy
+        >>> s = Stack()
+        >>> s.push(1)
+        >>> s2 = copy.deepcopy(s)
+        >>> s2.push(2)
+        >>> len(s), len(s2)
+        (1, 2)
+        """
+        return self._data
+
+    def __setstate__(self, data: list[Any]) -> None:
+        """Restore the backing container and rebind push to it."""
+        self._data = data
+        self.push = data.append
+
+    def is_empty(self) -> bool:
+        """Check if the stack is empty."""
+        return len(self._data) == 0
+
+    def __len__(self) -> int:
+        """Return the number of items in the stack."""
+        return len(self._data)
+
+
+class IntStack:
+    """
+    A Stack of machine integers backed by an array.array.
+
+    Each item is stored inline as a C integer (8 bytes for typecode "q") instead
+    of as a pointer to a separately allocated int object, so a large stack of
+    IDs takes a fraction of the memory. Items must fit the typecode.
+
+    Attributes
+    ----------
+    push : Callable[[int], None]
+        push(item) pushes an integer onto the stack. It is an instance attribute
+        bound to the backing array's append.
+
+    Examples
+    --------
+    >>> s = IntStack()
+    >>> s.push(10)
+    >>> s.push(20)
+    >>> s.peek(), len(s)
+    (20, 2)
+    >>> s.pop(), s.pop()
+    (20, 10)
+    >>> s.is_empty()
+    True
+    >>> try:
+    ...     s.pop()
+    ... except IndexError as e:
+    ...     print(e)
+    pop from empty stack
+    >>> s.push(2**63)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    OverflowError: int too big to convert
+    """
+
+    __slots__ = ("_data", "push")
+
+    def __init__(self, typecode: str = "q") -> None:
+        self._data = array(typecode)
+        self.push: Callable[[int], None] = self._data.append
+
+    def pop(self) -> int:
+        """Pop and return the top item from the stack.
+
+        Raises
+        ------
+        IndexError
+            If the stack is empty.
+        """
+        try:
+            return self._data.pop()
+        except IndexError:
+            msg = "pop from empty stack"
+            raise IndexError(msg) from None
+
+    def peek(self) -> int:
+        """Return the top item without removing it.
+
+        Raises
+        ------
+        IndexError
+            If the stack is empty.
+        """
+        try:
+            return self._data[-1]
+        except IndexError:
             msg = "peek from empty stack"
-            raise IndexError(msg)
-        return self._data[-1]
+            raise IndexError(msg) from None
+
+    def __getstate__(self) -> array[int]:
+        """
+        Return the backing container for copy and pickle.
+
+        The bound push is left out: it belongs to this instance's container,
+        so __setstate__ rebinds it to whichever container the copy receives.
+
+        Examples
+        --------
+        >>> import copy
+        >>> s = IntStack()
+        >>> s.push(1)
+        >>> s2 = copy.deepcopy(s)
+        >>> s2.push(2)
+        >>> len(s), len(s2)
+        (1, 2)
+        """
+        return self._data
+
+    def __setstate__(self, data: array[int]) -> None:
+        """Restore the backing container and rebind push to it."""
+        self._data = data
+        self.push = data.append
 
     def is_empty(self) -> bool:
         """Check if the stack is empty."""
@@ -131,10 +273,14 @@ def main() -> None:
     n = 1_000_000
     s = Stack()
 
-    # Time pushing n items
-    push_time = timeit.timeit(lambda: s.push(1), number=n)
+    # Time pushing n items. Each timing keeps the best of 5 runs, which filters out
+    # noise from other processes; a statement string is compiled into timeit's loop,
+    # so no lambda call is added to each operation.
+    push_time = min(
+        timeit.repeat("s.push(1)", globals={**globals(), **locals()}, repeat=5, number=n),
+    )
     # Time popping n items
-    pop_time = timeit.timeit(s.pop, number=n)
+    pop_time = min(timeit.repeat("s.pop()", globals={**globals(), **locals()}, repeat=5, number=n))
 
     print(
         f"Pushing {n} items took: {push_time:.5f}s for {n} operations (~{push_time / n:.9f}s each)",
@@ -144,6 +290,19 @@ def main() -> None:
     )
     print("Both push and pop show O(1) amortized performance.")
 
+    # The same workload on inline int64 storage
+    ints = IntStack()
+    int_push_time = min(
+        timeit.repeat("ints.push(1)", globals={**globals(), **locals()}, repeat=5, number=n),
+    )
+    int_pop_time = min(
+        timeit.repeat("ints.pop()", globals={**globals(), **locals()}, repeat=5, number=n),
+    )
+    print(
+        f"IntStack: pushing {n} items took {int_push_time:.5f}s, popping took "
+        f"{int_pop_time:.5f}s (8 bytes per item instead of a pointer to an int object)",
+    )
+
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,9 @@ A hash table uses a hash function to map keys to buckets. Python's dict is a dyn
 - Worst case: O(n) if all elements end up in the same bucket (rare due to good hash
 distribution).
 - Space: O(n) to store n key-value pairs.
+- When the keys are exactly the dense integers 0..n-1, no hashing is needed at all: a
+  direct-address table (value for key k stored at index k of an `array.array`) gives O(1)
+  access with one load and 8 bytes per int64 value.
 
 Complexities:
 - Insert: Average O(1), Worst O(n)
@@ -29,7 +32,9 @@ Show inserting, searching, and deleting from a dict.
 Run `python -m doctest -v thisfile.py` or `pytest --doctest-modules` to verify.
 """
 
+import sys
 import timeit
+from array import array
 
 
 def demonstrate_dict_operations() -> None:
@@ -47,6 +52,11 @@ def demonstrate_dict_operations() -> None:
     >>> del d['banana']  # delete O(1) average
     >>> 'banana' in d
     False
+    >>> from array import array
+    >>> flat = array("q", [0]) * 4  # direct-address table for keys 0..3
+    >>> flat[2] = 7  # "insert" key 2: store at index 2, no hashing
+    >>> flat[2], flat.itemsize
+    (7, 8)
     """
 
 
@@ -62,12 +72,16 @@ def main() -> None:
     ensuring quick metadata queries as data expands.
     """
     n = 1_000_000
-    d: dict[int, int] = {}
-    # Time inserting n items
-    insert_time = timeit.timeit(lambda: d.__setitem__(len(d), 1), number=n)
+    # Time inserting n items, into a fresh dict each run; keep the fastest of 5 runs
+    insert_time = min(
+        timeit.repeat("d[len(d)] = 1", setup="d = {}", globals=globals(), repeat=5, number=n),
+    )
+    d = dict.fromkeys(range(n), 1)
 
     # Time searching an existing key (like n-1) multiple times
-    search_time = timeit.timeit(lambda: n - 1 in d, number=1000)
+    search_time = min(
+        timeit.repeat("n - 1 in d", globals={**globals(), **locals()}, repeat=5, number=1000),
+    )
 
     print(
         f"Inserting {n} items into dict took: {insert_time:.5f}s total "
@@ -77,6 +91,37 @@ def main() -> None:
         f"Checking membership of a key 1000 times took: {search_time:.5f}s "
         f"(~{search_time / 1000:.9f}s per check)",
     )
+
+    # Building the same dict in one call keeps the insert loop in C (the table
+    # still grows as it fills; fromkeys presizes only from a dict or set source)
+    bulk_time = min(
+        timeit.repeat(
+            "dict.fromkeys(range(n), 1)", globals={**globals(), **locals()}, repeat=5, number=1
+        ),
+    )
+    print(
+        f"Building the same {n}-item dict with dict.fromkeys took: {bulk_time:.5f}s "
+        f"(~{bulk_time / n:.9f}s per item)",
+    )
+    # Keys 0..n-1 are dense, so a flat int64 array can stand in for the dict
+    flat = array("q", [0]) * n
+    flat_insert_time = min(
+        timeit.repeat(
+            "flat[next(keys)] = 1",
+            setup="from itertools import count; keys = count()",
+            globals={**globals(), **locals()},
+            repeat=5,
+            number=n,
+        ),
+    )
+    flat_search_time = min(
+        timeit.repeat("flat[n - 1]", globals={**globals(), **locals()}, repeat=5, number=1000),
+    )
+    print(
+        f"Direct-address array: {n} stores took {flat_insert_time:.5f}s, 1000 lookups "
+        f"{flat_search_time:.5f}s; {sys.getsizeof(flat):,} bytes vs the dict's "
+        f"{sys.getsizeof(d):,} bytes (before counting the dict's int objects)",
+    )
     print(
         "Average O(1) behavior demonstrated. Worst-case O(n) is rare with good hash distribution.",
     )
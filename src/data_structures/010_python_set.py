@@ -58,12 +58,16 @@ def main() -> None:
     uniqueness efficiently.
     """
     n = 1_000_000
-    s: set[int] = set()
 
-    # Inserting n items
-    insert_time = timeit.timeit(lambda: s.add(len(s)), number=n)
+    # Inserting n items, into a fresh set each run; keep the fastest of 5 runs
+    insert_time = min(
+        timeit.repeat("s.add(len(s))", setup="s = set()", globals=globals(), repeat=5, number=n),
+    )
+    s = set(range(n))
     # Check membership for an item known to exist
-    search_time = timeit.timeit(lambda: n - 1 in s, number=1000)
+    search_time = min(
+        timeit.repeat("n - 1 in s", globals={**globals(), **locals()}, repeat=5, number=1000),
+    )
 
     print(
         f"Inserting {n} items took: {insert_time:.5f} s "
@@ -73,6 +77,15 @@ def main() -> None:
         f"Checking membership of a known element 1000 times: "
         f"{search_time:.5f} s (~{search_time / 1000:.9f} s/check) average O(1)",
     )
+
+    # Building the same set in one call keeps the insert loop in C
+    bulk_time = min(
+        timeit.repeat("set(range(n))", globals={**globals(), **locals()}, repeat=5, number=1),
+    )
+    print(
+        f"Building the same {n}-item set with set(range(n)) took: {bulk_time:.5f} s "
+        f"(~{bulk_time / n:.9f} s/insert)",
+    )
     print("Demonstrates that set operations remain O(1) on average.")
 
 